@@ -4,11 +4,12 @@ import os
 import shutil
 import hashlib
 import jcs
-from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import InitVar, dataclass, field
 from enum import Enum
 from pathlib import Path
 
-from .git_operations import extract_zip, compute_tree_hash, pack_tar
+from .git_operations import extract_zip, compute_tree_hashes, compute_zip_tree_hashes, pack_tar
 from .config.transform_common import TREE_ALGORITHMS
 from .config.transform_release import COMMIT_FIELD_MAP
 from .config.generated_files import PublisherDestinations
@@ -33,8 +34,9 @@ class FileEntry:
     """Runtime representation of a single file in the pipeline.
 
     Config fields are fully resolved at creation (no None meaning 'use global').
-    identifier (sha256) and external_identifier are computed immediately at creation;
-    hashes are populated by pipeline steps.
+    identifier (sha256) and external_identifier are computed immediately at creation,
+    in a single read of the file (external_identifier from identity_hash_algo when
+    not given); hashes are populated by pipeline steps.
 
     type:       "file" | "sig" | "project" | "manifest" | "module_entry"
     config_key: references FileConfigEntry.key (sigs share the same key as their parent file)
@@ -56,17 +58,20 @@ class FileEntry:
     has_signature: bool = False           # whether this file needs to be signed
     # --- computed at creation (settable) ---
     external_identifier: str | None = None  # "{algo}:{hex}" using identity_hash_algo
+    identity_hash_algo: InitVar[str | None] = None
     # --- computed at creation (immutable sha256, set by __post_init__) ---
     identifier: str = field(init=False)
     # --- computed by pipeline steps ---
     hashes: dict = field(default_factory=dict)
 
-    def __post_init__(self):
-        h = hashlib.sha256()
-        with open(self.file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                h.update(chunk)
-        self.identifier = h.hexdigest()
+    def __post_init__(self, identity_hash_algo):
+        algos = {"sha256"}
+        if identity_hash_algo and self.external_identifier is None:
+            algos.add(identity_hash_algo)
+        raw = compute_file_hashes(self.file_path, algos)
+        self.identifier = raw["sha256"]["value"]
+        if identity_hash_algo and self.external_identifier is None:
+            self.external_identifier = raw[identity_hash_algo]["formatted_value"]
 
 
 
@@ -82,19 +87,41 @@ def format_hash_info(algorithm, hex_value):
     }
 
 
-def compute_file_hash(file_path: Path, algorithm: str) -> dict:
-    """Compute hash of a file. Returns {"type", "value", "formatted_value"}."""
-    h = hashlib.new(algorithm)
-    with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            h.update(chunk)
-    hex_value = h.hexdigest()
-    return format_hash_info(algorithm, hex_value)
+# Below this size, updating several hashers side by side is not worth the threads
+_PARALLEL_HASH_MIN_SIZE = 8 << 20
+
+# Files hashed at once by compute_hashes()
+_MAX_HASH_WORKERS = 4
+
 
+def compute_file_hashes(file_path: Path, algorithms) -> dict:
+    """Compute several hashes of a file in a single read.
 
-def compute_identity_hash(file_path: Path, algo: str) -> str:
-    """Compute the identity hash of a file. Returns "{algo}:{hex}" string."""
-    return compute_file_hash(file_path, algo)["formatted_value"]
+    On large files the hashers are updated in parallel (hashlib releases the
+    GIL on big buffers), so the time is bounded by the slowest algorithm.
+
+    Returns {algorithm: {"type", "value", "formatted_value"}}.
+    """
+    hashers = {algo: hashlib.new(algo) for algo in algorithms}
+    if not hashers:
+        return {}
+    with open(file_path, "rb") as f:
+        chunks = iter(lambda: f.read(1 << 20), b"")
+        if (len(hashers) > 1 and (os.cpu_count() or 1) > 1
+                and os.fstat(f.fileno()).st_size >= _PARALLEL_HASH_MIN_SIZE):
+            with ThreadPoolExecutor(max_workers=len(hashers)) as pool:
+                for chunk in chunks:
+                    for _ in pool.map(lambda h: h.update(chunk), hashers.values()):
+                        pass
+        elif len(hashers) == 1 and hasattr(hashlib, "file_digest"):
+            # Python 3.11+: read + update loop runs in C
+            (algo,) = hashers
+            hashers[algo] = hashlib.file_digest(f, algo)
+        else:
+            for chunk in chunks:
+                for h in hashers.values():
+                    h.update(chunk)
+    return {algo: format_hash_info(algo, h.hexdigest()) for algo, h in hashers.items()}
 
 
 # ---------------------------------------------------------------------------
@@ -102,8 +129,15 @@ def compute_identity_hash(file_path: Path, algo: str) -> str:
 # ---------------------------------------------------------------------------
 
 def process_project_archive(zip_path, filename, tree_algos=None, archive_format="zip",
-                            tar_args=None, gzip_args=None):
-    """Extract zip once for tree hashes and/or TAR conversion.
+                            tar_args=None, gzip_args=None, zip_data=None):
+    """Compute tree hashes and/or convert to TAR from the project zip.
+
+    The zip is extracted only for TAR conversion (once, shared with the tree
+    hashes). When the final format is zip, tree hashes are read straight
+    from the zip members.
+
+    zip_data is the zip content when it was kept in memory (zip_path not
+    written); it is only written to zip_path if the final format is zip.
 
     Returns (final_path, final_format, tree_hashes) where tree_hashes is {algo: hash}.
     """
@@ -111,31 +145,39 @@ def process_project_archive(zip_path, filename, tree_algos=None, archive_format=
     need_tar = archive_format in ("tar", "tar.gz")
     tree_hashes = {}
 
-    if not tree_algos and not need_tar:
+    tree_formats = [TREE_ALGORITHMS[a] for a in tree_algos]
+
+    if not need_tar:
+        if tree_algos:
+            by_format = compute_zip_tree_hashes(zip_path, tree_formats, data=zip_data)
+            for algo in tree_algos:
+                tree_hashes[algo] = by_format[TREE_ALGORITHMS[algo]]
+        if zip_data is not None:
+            zip_path.write_bytes(zip_data)
         return zip_path, "zip", tree_hashes
 
     extract_dir = zip_path.parent / "_content"
     extract_dir.mkdir()
     try:
-        content_dir = extract_zip(zip_path, extract_dir)
-
-        for algo in tree_algos:
-            tree_hashes[algo] = compute_tree_hash(content_dir, TREE_ALGORITHMS[algo])
-
-        if need_tar:
-            compress_gz = archive_format == "tar.gz"
-            ext = "tar.gz" if compress_gz else "tar"
-            tar_path = zip_path.parent / f"{filename}.{ext}"
-            env = {**os.environ, "LC_ALL": "C", "TZ": "UTC", "SOURCE_DATE_EPOCH": "0"}
-            pack_tar(content_dir, tar_path, compress_gz=compress_gz,
-                     tar_args=tar_args, gzip_args=gzip_args, env=env)
-            zip_path.unlink()
-            return tar_path, archive_format, tree_hashes
+        content_dir = extract_zip(zip_path, extract_dir, data=zip_data)
+
+        if tree_algos:
+            # One walk and one read per file for every requested tree algo
+            by_format = compute_tree_hashes(content_dir, tree_formats)
+            for algo in tree_algos:
+                tree_hashes[algo] = by_format[TREE_ALGORITHMS[algo]]
+
+        compress_gz = archive_format == "tar.gz"
+        ext = "tar.gz" if compress_gz else "tar"
+        tar_path = zip_path.parent / f"{filename}.{ext}"
+        env = {**os.environ, "LC_ALL": "C", "TZ": "UTC", "SOURCE_DATE_EPOCH": "0"}
+        pack_tar(content_dir, tar_path, compress_gz=compress_gz,
+                 tar_args=tar_args, gzip_args=gzip_args, env=env)
+        zip_path.unlink(missing_ok=True)
+        return tar_path, archive_format, tree_hashes
     finally:
         shutil.rmtree(extract_dir, ignore_errors=True)
 
-    return zip_path, "zip", tree_hashes
-
 
 # ---------------------------------------------------------------------------
 # Hashing for FileEntry entries
@@ -146,35 +188,52 @@ def compute_hashes(entries: list[FileEntry], algorithms: list[str] | set[str]) -
 
     Compute algorithms from config.
     Skips algorithms already present in entry.hashes (e.g. pre-computed tree hashes).
+    Entries are independent files: they are read on a thread pool.
     """
     all_algos = set(algorithms)
     tree_algos = {a for a in all_algos if a in TREE_ALGORITHMS}
     file_algos = all_algos - tree_algos
 
+    # (entry, algo label -> hashlib name still missing, hashlib name -> known hex)
+    plans = []
     for entry in entries:
-        hashes = dict(entry.hashes)  # keep pre-computed hashes
-
-        for algo in file_algos:
-            if algo in hashes:
-                continue
-            
-            if algo == "sha256":
-                hashes[algo] = format_hash_info("sha256", entry.identifier)
-                continue
-            
-            hashes[algo] = compute_file_hash(entry.file_path, algo)
-        
+        wanted = {algo: algo for algo in file_algos if algo not in entry.hashes}
         for algo in tree_algos:
-            if algo in hashes:
+            if algo in entry.hashes:
                 # already pre-computed (e.g. tree hashes for project)
                 continue
             if entry.type == "project":
                 # tree hashes must be pre-computed by caller (single extraction)
                 raise ValueError(f"Tree hash '{algo}' not pre-computed for project entry")
             # hashlib algo (e.g. sha1) but label with tree algo name
-            raw = compute_file_hash(entry.file_path, TREE_ALGORITHMS[algo])
-            hashes[algo] = format_hash_info(algo, raw['value'])
-
+            wanted[algo] = TREE_ALGORITHMS[algo]
+
+        # sha256 (identifier) and the identity algo (external_identifier) are
+        # known from creation; the rest share one read
+        known = {"sha256": entry.identifier}
+        if entry.external_identifier:
+            id_algo, _, id_value = entry.external_identifier.partition(":")
+            known.setdefault(id_algo, id_value)
+        plans.append((entry, wanted, known))
+
+    def read(plan) -> dict:
+        entry, wanted, known = plan
+        return compute_file_hashes(
+            entry.file_path, {name for name in wanted.values() if name not in known}
+        )
+
+    if len(plans) > 1:
+        with ThreadPoolExecutor(max_workers=min(_MAX_HASH_WORKERS, len(plans))) as pool:
+            results = list(pool.map(read, plans))
+    else:
+        results = [read(plan) for plan in plans]
+
+    for (entry, wanted, known), raw in zip(plans, results):
+        for name, value in known.items():
+            raw[name] = format_hash_info(name, value)
+        hashes = dict(entry.hashes)  # keep pre-computed hashes
+        for algo, name in wanted.items():
+            hashes[algo] = format_hash_info(algo, raw[name]["value"])
         entry.hashes = hashes
 
 
@@ -193,7 +193,7 @@ def cmd_release(args, test=None, debug=False):
         )
         return
 
-    from .pipeline import run_release
+    from .pipeline.release import run_release
     run_release(config, test=test)
 
 
@@ -208,7 +208,7 @@ def cmd_archive(args, test=None, debug=False):
         output.fatal(str(e), name="config_error.loading", exc=e)
         return
 
-    from .pipeline import run_archive
+    from .pipeline.archive import run_archive
     run_archive(config, test=test)
 
 
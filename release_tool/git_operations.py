@@ -1,8 +1,13 @@
 """Git operations and GitHub release management for the release tool."""
 
+import hashlib
+import io
 import json
+import os
+import stat
 import subprocess
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
@@ -20,6 +25,7 @@ class ArchiveResult:
     file_path: Path
     archive_name: str
     format: str  # "zip", "tar", "tar.gz"
+    data: bytes | None = None  # zip content when kept in memory (file_path not written)
 
 
 class GitError(ZPError):
@@ -32,6 +38,21 @@ class GitHubError(ZPError):
     _prefix = "github"
 
 
+# Independent git/gh queries are I/O bound (process spawn, network round-trips),
+# so they can overlap on a few threads.
+_MAX_QUERY_WORKERS = 4
+
+
+def _run_concurrently(*calls):
+    """Run independent zero-argument callables concurrently.
+
+    Returns the list of futures in call order. Callers read them with
+    ``.result()`` in the order they want errors to surface.
+    """
+    with ThreadPoolExecutor(max_workers=min(_MAX_QUERY_WORKERS, len(calls))) as pool:
+        return [pool.submit(call) for call in calls]
+
+
 def run_git_command(args: list[str], cwd: Path) -> str:
     """
     Run a git command and return output.
@@ -52,7 +73,7 @@ def run_git_command(args: list[str], cwd: Path) -> str:
             cwd=cwd,
             check=True,
             capture_output=True,
-            text=True,
+            encoding="utf-8",
         )
         # git dryrun write on stderr not stdout
         return result.stdout.strip()
@@ -60,9 +81,55 @@ def run_git_command(args: list[str], cwd: Path) -> str:
         raise GitError(f"Git command failed: {' '.join(args)}\n{e.stderr}", name="command_failed") from e
 
 
+def run_git_void(args: list[str], cwd: Path) -> None:
+    """
+    Run a git command whose stdout is not needed (fetch, clone, archive -o).
+
+    stdout goes to /dev/null; stderr is still captured for the error message.
+
+    Raises:
+        GitError: If command fails
+    """
+    try:
+        run_cmd(
+            ["git"] + args,
+            cwd=cwd,
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            encoding="utf-8",
+        )
+    except subprocess.CalledProcessError as e:
+        raise GitError(f"Git command failed: {' '.join(args)}\n{e.stderr}", name="command_failed") from e
+
+
+# Read-only ref lookups (rev-parse, remote get-url) keyed by (args, cwd).
+# Nothing in zp itself moves HEAD, so these only change when a fetch brings in
+# refs or a release creates a tag; those paths call invalidate_git_cache().
+# The pipeline also clears it after the build, which runs arbitrary commands.
+_git_cache: dict[tuple[tuple[str, ...], str], str] = {}
+
+
+def invalidate_git_cache() -> None:
+    """Forget memoized ref lookups, e.g. after the build step may have
+    touched the repository."""
+    _git_cache.clear()
+
+
+def _run_git_command_cached(args: list[str], cwd: Path) -> str:
+    """Like run_git_command(), memoized until invalidate_git_cache().
+
+    Only for read-only queries. Failures are not cached.
+    """
+    key = (tuple(args), str(cwd))
+    if key not in _git_cache:
+        _git_cache[key] = run_git_command(args, cwd)
+    return _git_cache[key]
+
+
 def get_current_branch(project_root: Path) -> str:
     """Get the current git branch name."""
-    return run_git_command(["rev-parse", "--abbrev-ref", "HEAD"], project_root)
+    return _run_git_command_cached(["rev-parse", "--abbrev-ref", "HEAD"], project_root)
 
 
 def check_on_main_branch(project_root: Path, main_branch: str) -> None:
@@ -84,7 +151,34 @@ def check_on_main_branch(project_root: Path, main_branch: str) -> None:
 def fetch_remote(project_root: Path) -> None:
     """Fetch updates from remote repository."""
     output.info("🔄 Fetching from remote...")
-    run_git_command(["fetch"], project_root)
+    run_git_void(["fetch"], project_root)
+    _invalidate_remote_tags(project_root)
+    invalidate_git_cache()
+
+
+# Remote tag names per project root, listed once per fetch. Invalidated by
+# fetch_remote() and create_github_release() (which pushes a new tag).
+_remote_tags_cache: dict[Path, set[str]] = {}
+
+
+def _invalidate_remote_tags(project_root: Path) -> None:
+    _remote_tags_cache.pop(Path(project_root), None)
+
+
+def list_remote_tags(project_root: Path) -> set[str]:
+    """Return the set of tag names on origin (cached until the next fetch)."""
+    key = Path(project_root)
+    if key not in _remote_tags_cache:
+        # --refs allow to remove ^{} defference like 'v0.3.0^{}'
+        remote_out = run_git_command(
+            ["ls-remote", "--tags", "--refs", "origin"], project_root
+        )
+        _remote_tags_cache[key] = {
+            line.partition("refs/tags/")[2]
+            for line in remote_out.splitlines()
+            if "refs/tags/" in line
+        }
+    return _remote_tags_cache[key]
 
 
 def is_up_to_date_with_remote(project_root: Path, main_branch: str) -> bool:
@@ -94,8 +188,10 @@ def is_up_to_date_with_remote(project_root: Path, main_branch: str) -> bool:
     Returns:
         True if up to date, False otherwise
     """
-    local = run_git_command(["rev-parse", main_branch], project_root)
-    remote = run_git_command(["rev-parse", f"origin/{main_branch}"], project_root)
+    # One rev-parse for both refs: prints one SHA per line, in argument order
+    local, remote = _run_git_command_cached(
+        ["rev-parse", main_branch, f"origin/{main_branch}"], project_root
+    ).splitlines()
     return local == remote
 
 def has_local_modifs(project_root: Path, main_branch: str) -> bool:
@@ -136,18 +232,7 @@ def has_unpushed_tags(project_root: Path) -> bool:
     local_tags = set(
         run_git_command(["tag", "-l"], project_root).splitlines()
     )
-    
-    # --refs allow to remove ^{} defference like 'v0.3.0^{}'
-    remote_out = run_git_command(
-        ["ls-remote", "--tags", "--refs", "origin"], project_root
-    )
-    remote_tags = {
-        line.split("/")[-1]
-        for line in remote_out.splitlines()
-        if line and "^{}" not in line  # ignorer les lignes de déréférencement
-    }
-    
-    return bool(local_tags - remote_tags)
+    return bool(local_tags - list_remote_tags(project_root))
 
 
 def check_up_to_date(project_root: Path, main_branch: str) -> None:
@@ -159,28 +244,37 @@ def check_up_to_date(project_root: Path, main_branch: str) -> None:
     """
     fetch_remote(project_root)
 
-    if has_local_modifs(project_root, main_branch):
+    # The checks below only read refs / the worktree: run them together
+    # (the tag check waits on ls-remote) and report in the usual order.
+    modifs_f, unpushed_f, up_to_date_f, unpushed_tags_f = _run_concurrently(
+        lambda: has_local_modifs(project_root, main_branch),
+        lambda: has_unpushed_commits(project_root, main_branch),
+        lambda: is_up_to_date_with_remote(project_root, main_branch),
+        lambda: has_unpushed_tags(project_root),
+    )
+
+    if modifs_f.result():
         raise GitError(
             f"Local branch has local modifications/commits\n"
             f"Please commit or stash your changes first",
             name="local_modifications",
         )
 
-    if has_unpushed_commits(project_root, main_branch):
+    if unpushed_f.result():
         raise GitError(
             "Local commits are not pushed to remote\n"
             "Please push first: git push",
             name="unpushed_commits",
         )
 
-    if not is_up_to_date_with_remote(project_root, main_branch):
+    if not up_to_date_f.result():
         raise GitError(
             f"Local branch is not up to date with origin/{main_branch}\n"
             f"Please pull the latest changes first",
             name="not_up_to_date",
         )
 
-    if has_unpushed_tags(project_root):
+    if unpushed_tags_f.result():
         raise GitError(
             "Local tags are not pushed to remote\n"
             "Please push tags first: git push --tags",
@@ -210,7 +304,7 @@ def run_gh_command(args: list[str], cwd: Path) -> str:
             cwd=cwd,
             check=True,
             capture_output=True,
-            text=True,
+            encoding="utf-8",
         )
         return result.stdout.strip()
     except subprocess.CalledProcessError as e:
@@ -225,29 +319,39 @@ def run_gh_command(args: list[str], cwd: Path) -> str:
         )
 
 
+# Latest GitHub release per project root (two gh spawns to resolve). The
+# release check and the post-compile verification both need it; only
+# create_github_release() changes it.
+_latest_release_cache: dict[Path, Optional[dict]] = {}
+
+
 def get_latest_release(project_root: Path) -> Optional[dict]:
     """
     Get the latest GitHub release.
 
+    Cached until a release is created.
+
     Returns:
         Dictionary with release info (tagName, name, body) or None if no releases
     """
+    key = Path(project_root)
+    if key not in _latest_release_cache:
+        _latest_release_cache[key] = _fetch_latest_release(project_root)
+    return _latest_release_cache[key]
+
+
+def _fetch_latest_release(project_root: Path) -> Optional[dict]:
     try:
-        # Get the list of releases, excluding drafts
-        result = run_gh_command(
-            ["release", "list", "--exclude-drafts", "--limit", "1", "--json", "tagName,name"],
+        # Get the latest release tag, excluding drafts. gh extracts the
+        # field itself (--jq), so there is no list payload to parse here.
+        latest_tag = run_gh_command(
+            ["release", "list", "--exclude-drafts", "--limit", "1",
+             "--json", "tagName", "--jq", ".[0].tagName // empty"],
             project_root
         )
-        if not result:
-            return None
-
-        releases = json.loads(result)
-        if not releases:
+        if not latest_tag:
             return None
 
-        # Get the latest release tag
-        latest_tag = releases[0]["tagName"]
-
         # Get full details including body, verify it's not a draft
         details = run_gh_command(
             ["release", "view", latest_tag, "--json", "tagName,name,body,isDraft"],
@@ -268,12 +372,13 @@ def get_commit_of_tag(project_root: Path, tag: str) -> str:
     Works for both lightweight and annotated tags : the ^{commit} suffix
     explicitly dereferences annotated tag objects to their underlying commit.
     """
-    return run_git_command(["rev-parse", f"{tag}^{{commit}}"], project_root)
+    return _run_git_command_cached(["rev-parse", f"{tag}^{{commit}}"], project_root)
 
 
 def fetch_tag(project_root: Path, tag: str) -> None:
     """Fetch a single tag from origin into the local repo."""
-    run_git_command(["fetch", "origin", "tag", tag], project_root)
+    run_git_void(["fetch", "origin", "tag", tag], project_root)
+    invalidate_git_cache()
 
 
 def get_tag_info(project_root: Path, tag: str) -> str:
@@ -283,11 +388,11 @@ def get_tag_info(project_root: Path, tag: str) -> str:
     For lightweight tags, sha equals the commit hash and annotation is empty.
     """
     # Tag object SHA (differs from commit SHA for annotated tags)
-    return run_git_command(["rev-parse", tag], project_root)
+    return _run_git_command_cached(["rev-parse", tag], project_root)
 
 def get_commit(project_root: Path, commit: str = "HEAD")  -> str:
     """Get the commit hash."""
-    return run_git_command(["rev-parse", commit], project_root)
+    return _run_git_command_cached(["rev-parse", commit], project_root)
     
 def get_latest_commit(project_root: Path) -> str:
     """Get the latest commit hash."""
@@ -301,14 +406,20 @@ def get_commit_info(project_root: Path, commit: str = "HEAD", tag_name=None) ->
         project_root: Path to project root
         commit: Commit reference (default: HEAD)
     """
-    # Commit info (single command)
-    result = run_git_command(
-        ["log", "-1", "--format=%H%n%ct%n%cn%n%ce%n%an%n%ae%n%s", commit], project_root
+    # Commit info (single command). Fields are separated by the ASCII unit
+    # separator (0x1F), which cannot appear in git names/emails/subjects.
+    # Branch and origin URL are independent lookups, run alongside it.
+    log_f, branch_f, origin_url_f = _run_concurrently(
+        lambda: run_git_command(
+            ["log", "-1", "--format=%H%x1f%ct%x1f%cn%x1f%ce%x1f%an%x1f%ae%x1f%s", commit], project_root
+        ),
+        lambda: get_current_branch(project_root),
+        lambda: get_remote_url(project_root),
     )
-    sha, timestamp, c_name, c_email, a_name, a_email, subject = result.split("\n", 6)
+    sha, timestamp, c_name, c_email, a_name, a_email, subject = log_f.result().split("\x1f", 6)
 
-    branch = get_current_branch(project_root)
-    origin_url = get_remote_url(project_root)
+    branch = branch_f.result()
+    origin_url = origin_url_f.result()
 
     result = {
         "ZP_COMMIT_DATE_EPOCH": timestamp,
@@ -335,7 +446,7 @@ def get_last_commit_info(project_root: Path, tag_name=None):
 
 def get_remote_latest_commit(project_root: Path, main_branch: str) -> str:
     """Get the latest commit hash from the remote main branch."""
-    return run_git_command(["rev-parse", f"origin/{main_branch}"], project_root)
+    return _run_git_command_cached(["rev-parse", f"origin/{main_branch}"], project_root)
 
 
 def tag_exists(project_root: Path, tag_name: str) -> bool:
@@ -349,20 +460,18 @@ def tag_exists(project_root: Path, tag_name: str) -> bool:
     Returns:
         True if tag exists, False otherwise
     """
-    try:
-        # Check if tag exists locally
-        run_git_command(["rev-parse", tag_name], project_root)
+    # Check if tag exists locally (exit code only, no output to parse)
+    result = run_cmd(
+        ["git", "show-ref", "--verify", "--quiet", f"refs/tags/{tag_name}"],
+        cwd=project_root,
+        stderr=subprocess.DEVNULL,
+    )
+    if result.returncode == 0:
         return True
-    except GitError:
-        pass
 
     try:
-        # Check if tag exists on remote using ls-remote
-        result = run_git_command(
-            ["ls-remote", "--tags", "origin", f"refs/tags/{tag_name}"],
-            project_root
-        )
-        return bool(result.strip())
+        # Check if tag exists on remote (reuses the listing made after fetch)
+        return tag_name in list_remote_tags(project_root)
     except GitError:
         return False
 
@@ -387,17 +496,30 @@ def check_tag_validity(project_root: Path, tag_name: str, main_branch: str,
     # so tag_exists would return False, but gh release create would
     # silently convert the draft into a published release)
     if check_draft:
-        _check_no_draft_release(project_root, tag_name)
+        # The draft scan (paginated API) and the tag lookup are independent;
+        # the draft result is read first so its error still takes precedence.
+        draft_f, exists_f = _run_concurrently(
+            lambda: _check_no_draft_release(project_root, tag_name),
+            lambda: tag_exists(project_root, tag_name),
+        )
+        draft_f.result()
+        exists = exists_f.result()
+    else:
+        exists = tag_exists(project_root, tag_name)
 
-    if not tag_exists(project_root, tag_name):
+    if not exists:
         output.info_ok("Tag '{tag}' does not exist yet", tag=tag_name, name="git.tag_new")
         return
 
     # Tag exists, check if it points to the latest remote commit
     output.warn("Tag '{tag}' already exists, verifying it points to latest commit...", tag=tag_name, name="git.tag_exists")
 
-    tag_commit = get_commit_of_tag(project_root, tag_name)
-    remote_latest = get_remote_latest_commit(project_root, main_branch)
+    tag_commit_f, remote_latest_f = _run_concurrently(
+        lambda: get_commit_of_tag(project_root, tag_name),
+        lambda: get_remote_latest_commit(project_root, main_branch),
+    )
+    tag_commit = tag_commit_f.result()
+    remote_latest = remote_latest_f.result()
 
     if tag_commit == remote_latest:
         output.info_ok("Tag '{tag}' points to the latest remote commit", tag=tag_name, name="git.tag_valid")
@@ -442,13 +564,17 @@ def is_latest_commit_released(project_root: Path) -> tuple[bool, Optional[dict]]
     Returns:
         Tuple of (is_released, release_info)
     """
-    latest_release = get_latest_release(project_root)
+    latest_release_f, latest_commit_f = _run_concurrently(
+        lambda: get_latest_release(project_root),
+        lambda: get_latest_commit(project_root),
+    )
+    latest_release = latest_release_f.result()
     if not latest_release:
         return False, None
 
     release_tag = latest_release["tagName"]
     tag_commit = get_commit_of_tag(project_root, release_tag)
-    latest_commit = get_latest_commit(project_root)
+    latest_commit = latest_commit_f.result()
 
     if tag_commit == latest_commit:
         return True, latest_release
@@ -477,6 +603,9 @@ def create_github_release(
         ["release", "create", tag_name, "--title", title, "--notes", notes],
         project_root
     )
+    _invalidate_remote_tags(project_root)
+    _latest_release_cache.pop(Path(project_root), None)
+    invalidate_git_cache()
 
     output.info_ok("Release '{tag}' created and published", tag=tag_name, name="github.release_published")
 
@@ -488,7 +617,12 @@ def verify_release_on_latest_commit(project_root: Path, tag_name: str) -> None:
     Raises:
         GitHubError: If release doesn't exist or doesn't point to latest commit
     """
-    latest_release = get_latest_release(project_root)
+    latest_release_f, tag_commit_f, latest_commit_f = _run_concurrently(
+        lambda: get_latest_release(project_root),
+        lambda: get_commit_of_tag(project_root, tag_name),
+        lambda: get_latest_commit(project_root),
+    )
+    latest_release = latest_release_f.result()
 
     if not latest_release:
         raise GitHubError("No releases found", name="no_releases")
@@ -500,8 +634,8 @@ def verify_release_on_latest_commit(project_root: Path, tag_name: str) -> None:
             name="tag_mismatch",
         )
 
-    tag_commit = get_commit_of_tag(project_root, tag_name)
-    latest_commit = get_latest_commit(project_root)
+    tag_commit = tag_commit_f.result()
+    latest_commit = latest_commit_f.result()
 
     if tag_commit != latest_commit:
         raise GitHubError(
@@ -519,6 +653,7 @@ def archive_zip_project(
     tag_name: str,
     project_name: str,
     output_dir: Path,
+    in_memory: bool = False,
 ) -> ArchiveResult:
     """
     Create a zip archive of the project at the given tag.
@@ -526,11 +661,16 @@ def archive_zip_project(
     Always creates the archive in a temporary directory. The caller is
     responsible for moving the file to a persistent location if needed.
 
+    With *in_memory*, the zip is read from the git archive pipe into
+    ``ArchiveResult.data`` and never written to disk; use it when the zip
+    is only an intermediate (e.g. repacked as tar).
+
     Args:
         project_root: Path to project root
         tag_name: Git tag to archive (used for naming)
         project_name: Project name for the archive
         output_dir: Directory for the output zip file
+        in_memory: Keep the zip in memory instead of writing it
 
     Returns:
         ArchiveResult with file path and metadata
@@ -541,13 +681,42 @@ def archive_zip_project(
     output_file = output_dir / f"{project_name}.zip"
 
     git_ref = get_git_ref(project_root, tag_name)
-    run_git_command(
-        ["archive", "--format=zip", f"--prefix={project_name}/", "-o", str(output_file), git_ref],
-        project_root
-    )
+    args = ["archive", "--format=zip", f"--prefix={project_name}/"]
+
+    if not in_memory:
+        run_git_void(args + ["-o", str(output_file), git_ref], project_root)
+        output.info_ok("Created archive: {output_file}", output_file=str(output_file), name="archive.created")
+        return ArchiveResult(file_path=output_file, archive_name=project_name, format="zip")
 
-    output.info_ok("Created archive: {output_file}", output_file=str(output_file), name="archive.created")
-    return ArchiveResult(file_path=output_file, archive_name=project_name, format="zip")
+    args.append(git_ref)
+    try:
+        result = run_cmd(
+            ["git"] + args,
+            cwd=project_root,
+            check=True,
+            capture_output=True,
+        )
+    except subprocess.CalledProcessError as e:
+        stderr = e.stderr.decode(errors="replace") if e.stderr else ""
+        raise GitError(f"Git command failed: {' '.join(args)}\n{stderr}", name="command_failed") from e
+
+    # Nothing is written to output_file: report the in-memory zip instead
+    output.info_ok("Created archive {project_name} in memory ({size} bytes)",
+                   project_name=project_name, size=len(result.stdout),
+                   name="archive.created_in_memory")
+    return ArchiveResult(file_path=output_file, archive_name=project_name, format="zip",
+                         data=result.stdout)
+
+
+# stderr fragments (lowercased) meaning the remote will not run
+# upload-archive at all, as opposed to failing the request itself:
+# HTTP(S) transports, git daemon without uploadarch, GitHub over SSH.
+_REMOTE_ARCHIVE_UNSUPPORTED = (
+    "operation not supported by protocol",
+    "access denied or repository not exported",
+    "service not enabled",
+    "invalid command",
+)
 
 
 def archive_zip_remote_project(
@@ -559,8 +728,16 @@ def archive_zip_remote_project(
     """
     Create a zip archive from a remote git repository at the given tag.
 
-    Performs a shallow fetch of the tag into a temporary repository,
-    runs git archive, then cleans up. No .zenodo.env required.
+    First asks the remote to build the archive itself (``git archive
+    --remote``), which needs no local object database. Hosts that do not
+    serve upload-archive (GitHub, HTTPS remotes) fall back to a shallow
+    bare clone of the tag followed by a local git archive. Any other
+    failure (auth, unknown tag, network) is raised as is. No .zenodo.env
+    required.
+
+    The fallback archive is built by the local git with its own config
+    and attribute handling (export-ignore, export-subst, ...), so its
+    bytes can differ from what the remote would have produced.
 
     Args:
         repo_url: Git remote URL (HTTPS or SSH)
@@ -575,22 +752,38 @@ def archive_zip_remote_project(
     """
 
     output_file = output_dir / f"{project_name}.zip"
+    archive_args = ["archive", "--format=zip", f"--prefix={project_name}/", "-o", str(output_file)]
 
-    tmp_dir = Path(tempfile.mkdtemp())
-    tmp_repo = tmp_dir / "tmp_repo"
+    # Scratch space lives under output_dir (the run's temp directory), so a
+    # crash before the cleanup below still leaves nothing in the system tmp.
+    tmp_dir = Path(tempfile.mkdtemp(prefix=".remote-", dir=output_dir))
 
     try:
-        refspec = f"refs/tags/{tag_name}:refs/tags/{tag_name}"
-
-        run_git_command(["init", str(tmp_repo)], cwd=tmp_dir)
-        run_git_command(["remote", "add", "origin", repo_url], cwd=tmp_repo)
-        run_git_command(["fetch", "--depth=1", "origin", refspec], cwd=tmp_repo)
-
-        git_ref = get_git_ref(tmp_repo, tag_name)
-        run_git_command(
-            ["archive", "--format=zip", f"--prefix={project_name}/", "-o", str(output_file), git_ref],
-            cwd=tmp_repo,
-        )
+        remote_args = archive_args + [f"--remote={repo_url}", f"refs/tags/{tag_name}"]
+        try:
+            run_cmd(
+                ["git"] + remote_args,
+                cwd=tmp_dir,
+                check=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                encoding="utf-8",
+            )
+        except subprocess.CalledProcessError as e:
+            stderr = e.stderr or ""
+            if not any(marker in stderr.lower() for marker in _REMOTE_ARCHIVE_UNSUPPORTED):
+                raise GitError(f"Git command failed: {' '.join(remote_args)}\n{stderr}",
+                               name="command_failed") from e
+            output.detail("Remote does not serve git archive ({reason}), fetching tag {tag}...",
+                          reason=stderr.strip(), tag=tag_name, name="archive.remote_fallback")
+            output_file.unlink(missing_ok=True)
+            tmp_repo = tmp_dir / "tmp_repo"
+            run_git_void(
+                ["clone", "--bare", "--depth=1", f"--branch={tag_name}", repo_url, str(tmp_repo)],
+                cwd=tmp_dir,
+            )
+            git_ref = get_git_ref(tmp_repo, tag_name)
+            run_git_void(archive_args + [git_ref], cwd=tmp_repo)
 
         output.info_ok("Created archive: {output_file}", output_file=str(output_file), name="archive.created")
         return ArchiveResult(file_path=output_file, archive_name=project_name, format="zip")
@@ -604,29 +797,159 @@ def get_remote_url(project_root: Path) -> str:
     Raises:
         GitError: If the remote URL cannot be retrieved
     """
-    return run_git_command(["remote", "get-url", "origin"], project_root)
+    return _run_git_command_cached(["remote", "get-url", "origin"], project_root)
 
 
 # ---------------------------------------------------------------------------
 # Post-archive utilities (extract, tree hash, reproducible tar)
 # ---------------------------------------------------------------------------
 
-def extract_zip(zip_path: Path, dest_dir: Path) -> Path:
+def extract_zip(zip_path: Path, dest_dir: Path, data: bytes | None = None) -> Path:
     """Extract a ZIP archive into dest_dir.
 
+    Reads from *data* (in-memory zip content) when given, else from zip_path.
+
     If the ZIP contains a single root directory (e.g. ProjectName-tag/),
     returns that subdirectory. Otherwise returns dest_dir.
     """
-    with zipfile.ZipFile(zip_path, "r") as zf:
+    source = io.BytesIO(data) if data is not None else zip_path
+    with zipfile.ZipFile(source, "r") as zf:
         zf.extractall(dest_dir)
 
-    entries = list(dest_dir.iterdir())
-    if len(entries) == 1 and entries[0].is_dir():
-        return entries[0]
+    # Only the first two entries are needed to detect a single root directory
+    with os.scandir(dest_dir) as it:
+        first = next(it, None)
+        second = next(it, None)
+    if first is not None and second is None and first.is_dir():
+        return Path(first.path)
     return dest_dir
 
 
-def compute_tree_hash(content_dir: Path, object_format: str = "sha1") -> str:
+# Git object modes used in tree entries
+_MODE_FILE = b"100644"
+_MODE_EXEC = b"100755"
+_MODE_SYMLINK = b"120000"
+_MODE_TREE = b"40000"
+
+
+def _hash_git_object(kind: bytes, payload: bytes, object_format: str) -> bytes:
+    """Return the raw digest of a git object ("<kind> <size>\\0<payload>")."""
+    h = hashlib.new(object_format)
+    h.update(b"%s %d\0" % (kind, len(payload)))
+    h.update(payload)
+    return h.digest()
+
+
+def _hash_git_blob_file(path: str, size: int, object_formats: tuple[str, ...]) -> dict[str, bytes]:
+    """Return {object_format: raw digest} of a file as a git blob.
+
+    The file is streamed once and fed to one hasher per object format.
+    """
+    hashers = [hashlib.new(fmt) for fmt in object_formats]
+    header = b"blob %d\0" % size
+    for h in hashers:
+        h.update(header)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            for h in hashers:
+                h.update(chunk)
+    return {fmt: h.digest() for fmt, h in zip(object_formats, hashers)}
+
+
+def _scan_git_tree_dir(dir_path: str, object_formats: tuple[str, ...], pool) -> list:
+    """Walk *dir_path* and queue every file's blob hash on *pool*.
+
+    Returns the tree entries as (sort_key, mode, name, value) where value is
+    a Future of blob digests, a dict of symlink digests, or the entry list
+    of a subdirectory. Entries are sorted the git way (directory names
+    compare as if suffixed with "/").
+    """
+    entries = []
+    with os.scandir(dir_path) as it:
+        for e in it:
+            if e.name == ".git":
+                continue
+            name = os.fsencode(e.name)
+            if e.is_symlink():
+                target = os.fsencode(os.readlink(e.path))
+                entries.append((name, _MODE_SYMLINK, name,
+                                {fmt: _hash_git_object(b"blob", target, fmt)
+                                 for fmt in object_formats}))
+            elif e.is_dir():
+                entries.append((name + b"/", _MODE_TREE, name,
+                                _scan_git_tree_dir(e.path, object_formats, pool)))
+            elif e.is_file():
+                st = e.stat()
+                mode = _MODE_EXEC if st.st_mode & stat.S_IXUSR else _MODE_FILE
+                entries.append((name, mode, name,
+                                pool.submit(_hash_git_blob_file, e.path, st.st_size, object_formats)))
+    entries.sort(key=lambda entry: entry[0])
+    return entries
+
+
+def _hash_git_tree_entries(entries: list, object_formats: tuple[str, ...]) -> dict[str, bytes] | None:
+    """Return {object_format: raw digest} of a scanned tree, or None if it holds no file.
+
+    Mirrors what ``git add --all`` + ``git write-tree`` records when nothing
+    is ignored:
+    regular files (executable bit → 100755), symlinks (target as blob
+    content), subdirectories as trees, empty directories omitted.
+    """
+    resolved = []
+    for _, mode, name, value in entries:
+        if mode == _MODE_TREE:
+            value = _hash_git_tree_entries(value, object_formats)
+            if value is None:
+                continue
+        elif not isinstance(value, dict):
+            value = value.result()
+        resolved.append((mode, name, value))
+
+    if not resolved:
+        return None
+
+    return {
+        fmt: _hash_git_object(
+            b"tree",
+            b"".join(mode + b" " + name + b"\0" + digests[fmt]
+                     for mode, name, digests in resolved),
+            fmt,
+        )
+        for fmt in object_formats
+    }
+
+
+def _git_excludes_file_configured(cwd: Path) -> bool:
+    """Whether ``git add`` in a fresh repo would apply an excludes file.
+
+    That is core.excludesFile from the system/global config, or its default
+    location ($XDG_CONFIG_HOME/git/ignore, ~/.config/git/ignore), when the
+    file exists.
+    """
+    result = run_cmd(
+        ["git", "config", "--type=path", "--get", "core.excludesFile"],
+        cwd=cwd,
+        capture_output=True,
+        encoding="utf-8",
+    )
+    path = result.stdout.strip()
+    if not path:
+        config_home = os.environ.get("XDG_CONFIG_HOME") or os.path.expanduser("~/.config")
+        path = os.path.join(config_home, "git", "ignore")
+    return os.path.isfile(path)
+
+
+def _has_gitignore(content_dir: Path) -> bool:
+    """Whether a .gitignore file sits anywhere under content_dir."""
+    for dirpath, dirnames, filenames in os.walk(content_dir):
+        if ".gitignore" in filenames:
+            return True
+        if ".git" in dirnames:
+            dirnames.remove(".git")
+    return False
+
+
+def _git_write_tree(content_dir: Path, object_format: str) -> str:
     """Compute a git tree hash by initing git directly in content_dir.
 
     Initialises a temporary git repo in *content_dir* with the requested
@@ -642,12 +965,127 @@ def compute_tree_hash(content_dir: Path, object_format: str = "sha1") -> str:
     git_dir = content_dir / ".git"
     if git_dir.exists():
         raise GitError(f"content_dir already contains .git: {content_dir}", name="tree_hash_conflict")
-    
-    run_git_command(["init", f"--object-format={object_format}", "."], cwd=content_dir)
-    run_git_command(["config", "user.email", "noop@noop.local"], cwd=content_dir)
-    run_git_command(["config", "user.name", "noop"], cwd=content_dir)
-    run_git_command(["add", "--all"], cwd=content_dir)
-    return run_git_command(["write-tree"], cwd=content_dir)
+
+    try:
+        run_git_command(["init", f"--object-format={object_format}", "."], cwd=content_dir)
+        run_git_command(["config", "user.email", "noop@noop.local"], cwd=content_dir)
+        run_git_command(["config", "user.name", "noop"], cwd=content_dir)
+        run_git_command(["add", "--all"], cwd=content_dir)
+        return run_git_command(["write-tree"], cwd=content_dir)
+    finally:
+        shutil.rmtree(git_dir, ignore_errors=True)
+
+
+def compute_tree_hashes(content_dir: Path, object_formats) -> dict[str, str]:
+    """Compute the git tree hash of content_dir for several object formats.
+
+    Produces the same values as ``git init --object-format=<object_format>``
+    + ``git add --all`` + ``git write-tree`` run inside *content_dir*.
+
+    When no ignore rule can apply (no .gitignore in the content, no
+    excludes file in the git config), the git objects are hashed in-process:
+    no subprocess, no index and no object database written to disk. Each
+    file is read once for all formats, and files are hashed on a thread pool
+    (hashlib releases the GIL on large updates). Otherwise git itself is run
+    so that ignored paths are left out exactly as ``git add --all`` does.
+
+    Returns {object_format: hex digest}.
+    """
+    object_formats = tuple(dict.fromkeys(object_formats))
+    if _has_gitignore(content_dir) or _git_excludes_file_configured(content_dir):
+        return {fmt: _git_write_tree(content_dir, fmt) for fmt in object_formats}
+
+    with ThreadPoolExecutor() as pool:
+        entries = _scan_git_tree_dir(str(content_dir), object_formats, pool)
+        digests = _hash_git_tree_entries(entries, object_formats)
+    if digests is None:
+        digests = {fmt: _hash_git_object(b"tree", b"", fmt) for fmt in object_formats}
+    return {fmt: digest.hex() for fmt, digest in digests.items()}
+
+
+def _hash_zip_blob(zf: zipfile.ZipFile, info: zipfile.ZipInfo,
+                   object_formats: tuple[str, ...]) -> dict[str, bytes]:
+    """Return {object_format: raw digest} of a zip member as a git blob."""
+    hashers = [hashlib.new(fmt) for fmt in object_formats]
+    header = b"blob %d\0" % info.file_size
+    for h in hashers:
+        h.update(header)
+    with zf.open(info) as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            for h in hashers:
+                h.update(chunk)
+    return {fmt: h.digest() for fmt, h in zip(object_formats, hashers)}
+
+
+def compute_zip_tree_hashes(zip_path: Path, object_formats, data: bytes | None = None) -> dict[str, str]:
+    """Compute the tree hashes extract_zip() + compute_tree_hashes() would give,
+    reading the members straight from the zip instead of extracting them.
+
+    Reads from *data* (in-memory zip content) when given, else from zip_path.
+
+    Follows what zipfile extraction leaves on disk: every member is a plain
+    100644 file (no exec bit, symlinks become files holding their target),
+    "", "." and ".." path components are dropped, and a single root
+    directory is stripped like extract_zip() does.
+
+    Like compute_tree_hashes(), the value equals ``git add --all`` +
+    ``git write-tree`` over the extracted content: when the zip holds a
+    .gitignore or the git config sets an excludes file, the zip is
+    extracted next to zip_path and hashed by compute_tree_hashes() so
+    ignored paths are left out.
+    """
+    object_formats = tuple(dict.fromkeys(object_formats))
+    root: dict = {}  # name -> subdir dict, or file digests in a tuple
+    source = io.BytesIO(data) if data is not None else zip_path
+    with zipfile.ZipFile(source, "r") as zf:
+        ships_gitignore = any(
+            not info.is_dir() and info.filename.rsplit("/", 1)[-1] == ".gitignore"
+            for info in zf.infolist()
+        )
+        if ships_gitignore or _git_excludes_file_configured(zip_path.parent):
+            with tempfile.TemporaryDirectory(prefix=".tree-", dir=zip_path.parent) as tmp:
+                content_dir = extract_zip(zip_path, Path(tmp), data=data)
+                return compute_tree_hashes(content_dir, object_formats)
+
+        for info in zf.infolist():
+            parts = [p for p in info.filename.split("/") if p not in ("", ".", "..")]
+            if not parts:
+                continue
+            node = root
+            for part in parts[:-1]:
+                child = node.get(part)
+                if not isinstance(child, dict):
+                    child = node[part] = {}
+                node = child
+            if info.is_dir():
+                if not isinstance(node.get(parts[-1]), dict):
+                    node[parts[-1]] = {}
+            else:
+                node[parts[-1]] = (_hash_zip_blob(zf, info, object_formats),)
+
+    # extract_zip() returns the single root directory when there is one
+    if len(root) == 1:
+        (only,) = root.values()
+        if isinstance(only, dict):
+            root = only
+
+    def to_entries(node: dict) -> list:
+        entries = []
+        for part, child in node.items():
+            if part == ".git":
+                continue
+            name = os.fsencode(part)
+            if isinstance(child, dict):
+                entries.append((name + b"/", _MODE_TREE, name, to_entries(child)))
+            else:
+                entries.append((name, _MODE_FILE, name, child[0]))
+        entries.sort(key=lambda entry: entry[0])
+        return entries
+
+    digests = _hash_git_tree_entries(to_entries(root), object_formats)
+    if digests is None:
+        digests = {fmt: _hash_git_object(b"tree", b"", fmt) for fmt in object_formats}
+    return {fmt: digest.hex() for fmt, digest in digests.items()}
 
 
 def pack_tar(
@@ -670,16 +1108,26 @@ def pack_tar(
     """
     parent = content_dir.parent
     dirname = content_dir.name
+    source = ["-C", str(parent), dirname]
 
-    # 1. Always produce the .tar first
-    tar_path = output_path if not compress_gz else output_path.with_suffix("")
-    tar_cmd = ["tar"] + (tar_args or []) + ["-cf", str(tar_path), "-C", str(parent), dirname]
-    run_cmd(tar_cmd, check=True, env=env)
+    if not compress_gz:
+        run_cmd(["tar"] + (tar_args or []) + ["-cf", str(output_path)] + source, check=True, env=env)
+        return
 
-    # 2. Compress with gzip if tar.gz requested
-    #    gzip replaces file.tar with file.tar.gz automatically
-    if compress_gz:
-        run_cmd(["gzip"] + (gzip_args or []) + [str(tar_path)], check=True, env=env)
+    # tar.gz: pipe tar into gzip so the uncompressed .tar never hits the disk.
+    # Same bytes as gzip on a file: --no-name stores neither name nor mtime.
+    tar_cmd = ["tar"] + (tar_args or []) + ["-cf", "-"] + source
+    output.cmd(tar_cmd)
+    with open(output_path, "wb") as out:
+        tar_proc = subprocess.Popen(tar_cmd, stdout=subprocess.PIPE, env=env)
+        try:
+            run_cmd(["gzip"] + (gzip_args or []) + ["--stdout"],
+                    stdin=tar_proc.stdout, stdout=out, check=True, env=env)
+        finally:
+            tar_proc.stdout.close()
+            tar_returncode = tar_proc.wait()
+    if tar_returncode != 0:
+        raise subprocess.CalledProcessError(tar_returncode, tar_cmd)
 
 
 
@@ -690,33 +1138,48 @@ def get_release_asset_digest(
 ) -> str | None:
     """Return the SHA256 digest of a release asset, or None if it doesn't exist.
 
-    Uses the REST API (gh api) because gh release view does not expose the digest field.
+    Reads the cached asset list from list_release_assets(), so checking
+    several assets costs a single API call.
     """
     try:
-        result = run_gh_command(
-            ["api", "repos/{owner}/{repo}/releases/tags/" + tag_name,
-             "--jq", f'.assets[] | select(.name == "{asset_name}") | .digest'],
-            project_root,
-        )
-        if result:
-            return result  # e.g. "sha256:29ca0d..."
+        assets = list_release_assets(project_root, tag_name)
     except GitHubError:
-        pass
+        return None
+    for asset in assets:
+        if asset.get("name") == asset_name:
+            return asset.get("digest")  # e.g. "sha256:29ca0d..."
     return None
 
 
 
-def upload_release_asset(
+def upload_release_assets(
     project_root: Path,
     tag_name: str,
-    file_path: Path,
+    file_paths: list[Path],
     clobber: bool = False,
 ) -> None:
-    """Upload a file as a GitHub release asset."""
-    args = ["release", "upload", tag_name, str(file_path)]
+    """Upload several files as GitHub release assets with a single gh call."""
+    if not file_paths:
+        return
+    args = ["release", "upload", tag_name, *(str(p) for p in file_paths)]
     if clobber:
         args.append("--clobber")
     run_gh_command(args, project_root)
+    _invalidate_release_assets(project_root, tag_name)
+
+
+# Release assets per (project root, tag), fetched once with the REST API
+# (gh release view does not expose the digest field). Invalidated by
+# upload_release_assets() and delete_release_asset().
+_release_assets_cache: dict[tuple[Path, str], list[dict]] = {}
+
+
+def _invalidate_release_assets(project_root: Path, tag_name: str | None = None) -> None:
+    if tag_name is not None:
+        _release_assets_cache.pop((Path(project_root), tag_name), None)
+        return
+    for key in [k for k in _release_assets_cache if k[0] == Path(project_root)]:
+        del _release_assets_cache[key]
 
 
 def list_release_assets(project_root: Path, tag_name: str) -> list[dict]:
@@ -724,7 +1187,12 @@ def list_release_assets(project_root: Path, tag_name: str) -> list[dict]:
 
     Returns an empty list if the release does not exist or has no assets.
     digest is a sha256 string like "sha256:abc123..." or None if unavailable.
+    The list is cached until an asset is uploaded or deleted.
     """
+    key = (Path(project_root), tag_name)
+    if key in _release_assets_cache:
+        return _release_assets_cache[key]
+
     result = run_gh_command(
         ["api", f"repos/{{owner}}/{{repo}}/releases/tags/{tag_name}",
             "--jq", ".assets[] | {name: .name, id: .id, digest: .digest}"],
@@ -738,6 +1206,7 @@ def list_release_assets(project_root: Path, tag_name: str) -> list[dict]:
             if line:
                 assets.append(json.loads(line))
 
+    _release_assets_cache[key] = assets
     return assets
 
 
@@ -747,4 +1216,5 @@ def delete_release_asset(project_root: Path, asset_id: int) -> None:
         ["api", "--method", "DELETE",
          f"repos/{{owner}}/{{repo}}/releases/assets/{asset_id}"],
         project_root,
-    )
\ No newline at end of file
+    )
+    _invalidate_release_assets(project_root)
\ No newline at end of file
@@ -1,5 +1,6 @@
 """GPG signing operations using python-gnupg."""
 
+from functools import lru_cache
 from pathlib import Path
 
 import gnupg
@@ -24,8 +25,13 @@ def _read_gpg_conf_default_key() -> str | None:
     return None
 
 
+@lru_cache(maxsize=1)
 def _get_gpg_instance() -> gnupg.GPG:
-    """Create a python-gnupg GPG instance."""
+    """Return the shared python-gnupg GPG instance.
+
+    Constructing one runs ``gpg --version``; the instance holds no
+    per-operation state, so key lookup and every signature reuse it.
+    """
     # python-gnupg uses a logger named "gnupg" internally to log gpg command
     # lines and status messages (see https://gnupg.readthedocs.io/en/stable/).
     # By attaching our handler previously defined, these messages appear in --debug output without
@@ -107,21 +113,26 @@ def gpg_sign_file(file_path: Path, output_dir: Path, gpg_uid: str = None,
             name="sign_no_output",
         )
 
-    # Verify the detached signature against the original file
-    with open(sig_path, "rb") as f:
-        verified = gpg.verify_file(f, data_filename=str(file_path))
-    if not verified.valid:
-        raise GpgError(f"GPG signing failed for {file_path.name}:\n{sig.stderr}", name="sign_failed")
-    if gpg_uid and gpg_uid.lower() not in verified.fingerprint.lower():
+    # gpg reports SIG_CREATED with the signing key fingerprint; trust that
+    # rather than spawning a second gpg to verify. Only fall back to
+    # verifying the detached signature when the status line is missing.
+    fingerprint = sig.fingerprint if sig.status == "signature created" else None
+    if not fingerprint:
+        with open(sig_path, "rb") as f:
+            verified = gpg.verify_file(f, data_filename=str(file_path))
+        if not verified.valid:
+            raise GpgError(f"GPG signing failed for {file_path.name}:\n{sig.stderr}", name="sign_failed")
+        fingerprint = verified.fingerprint
+    if gpg_uid and gpg_uid.lower() not in fingerprint.lower():
         raise GpgError(
             f"Signature key mismatch for {file_path.name}: "
-            f"expected '{gpg_uid}', got fingerprint '{verified.fingerprint}'",
+            f"expected '{gpg_uid}', got fingerprint '{fingerprint}'",
             name="key_mismatch",
         )
 
-    output.detail_ok("{sig_name} created (verified: {short_fingerprint})",
-                     sig_name=sig_path.name, short_fingerprint=verified.fingerprint[-16:],
-                     ingerprint=verified.fingerprint, name="signed")
+    output.detail_ok("{sig_name} created (signer fingerprint: {short_fingerprint})",
+                     sig_name=sig_path.name, short_fingerprint=fingerprint[-16:],
+                     fingerprint=fingerprint, name="signed")
     return sig_path
 
 
@@ -36,7 +36,6 @@ def compile(compile_dir: Path, make_args: list[str] | None = None, env_vars: dic
             cmd,
             cwd=compile_dir,
             check=True,
-            text=True,
             env=env,
         )
         output.info_ok("Compilation successful", name="ok")
@@ -16,6 +16,7 @@ Levels:
 import json
 import sys
 import os
+import threading
 import traceback
 from dataclasses import dataclass
 from pathlib import Path
@@ -86,6 +87,9 @@ class Output:
         self.test_mode = False
         self.test_config = None  # TestConfig | None
         self._debug = False
+        # Events may come from worker threads (concurrent git/gh queries,
+        # signing, uploads): one writer at a time keeps lines whole
+        self._write_lock = threading.RLock()
 
     # -- Setup --------------------------------------------------------------
 
@@ -137,10 +141,12 @@ class Output:
         data = event.get("data", {})
         msg = event.get("msg", "")
 
-        # Validate: every {key} in msg must exist in data
+        # Validate: every {key} in msg must exist in data. The resolved text
+        # is kept for human output so the template is formatted only once.
+        text = msg
         if data and "{" in msg:
             try:
-                msg.format(**data)
+                text = msg.format(**data)
             except KeyError as e:
                 raise RuntimeError(
                     f"output template references unknown key {e}: "
@@ -154,19 +160,13 @@ class Output:
             raise ValueError(f"Source type '{source_type}' is not allowed. Expected one of: {ALLOWED_SOURCE_TYPES}")
         
         if self.test_mode:
-            print(json.dumps(event, default=str), flush=True)
+            line = json.dumps(event, default=str) + "\n"
+            with self._write_lock:
+                sys.stdout.write(line)
+                sys.stdout.flush()
         else:
-            self._format_human(event)
-    
-    def emit(self, event: dict, source_type: str = None, source: str = None):
-        
-        source_type = source_type or event.get("source_type", "")
-        source = source or event.get("source", "")
-        
-        event["source_type"] = source_type or "in_app"
-        event["source"] = source or ""
-        
-        self._emit(event)
+            with self._write_lock:
+                self._format_human(event, text)
     
     def emit(self, event: dict, source_type: str | None = None, source: str | None = None):
         resolved_type = source_type or event.get("source_type") or _DEFAULT_SOURCE_TYPE
@@ -187,15 +187,12 @@ class Output:
     def module_emit(self, event, module_name=None):
         self.emit(event, source_type="module", source=module_name)
 
-    def _format_human(self, event: dict):
-        """Translate a JSON event into the legacy human-friendly output."""
-        t = event["type"]
-        msg = event.get("msg", "")
-        data = event.get("data", {})
+    def _format_human(self, event: dict, msg: str):
+        """Translate a JSON event into the legacy human-friendly output.
 
-        # Resolve template if data present
-        if data and "{" in msg:
-            msg = msg.format(**data)
+        msg is the event message with its template already resolved.
+        """
+        t = event["type"]
 
         if t == "step":
             print(f"{self.label} {msg}")
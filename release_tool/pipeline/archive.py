@@ -10,7 +10,7 @@ from ..git_operations import (
     archive_zip_project, archive_zip_remote_project,
     get_remote_url, get_commit_of_tag, GitError,
 )
-from ..archive_operation import compute_file_hash, process_project_archive
+from ..archive_operation import compute_file_hashes, process_project_archive
 from ..config.transform_common import TREE_ALGORITHMS
 from .. import output
 from ._common import setup_pipeline
@@ -39,8 +39,12 @@ def _step_archive(
     remote_url: Optional[str],
     no_cache: bool,
     output_dir: Path,
+    in_memory: bool = False,
 ) -> ArchiveResult:
-    """Create a ZIP archive from local repo or remote. Returns ArchiveResult."""
+    """Create a ZIP archive from local repo or remote. Returns ArchiveResult.
+
+    in_memory keeps the local zip in ArchiveResult.data (see archive_zip_project).
+    """
     if remote_url:
         return archive_zip_remote_project(
             remote_url, tag_name, project_name, output_dir)
@@ -53,7 +57,8 @@ def _step_archive(
 
     try:
         return archive_zip_project(
-            project_root, tag_name, project_name, output_dir)
+            project_root, tag_name, project_name, output_dir,
+            in_memory=in_memory)
     except GitError:
         output.warn(
             "Hint: use --no-cache to archive from the remote origin "
@@ -71,6 +76,11 @@ def _step_display(
     labels = ["Archive"] + all_algos
     pad = max(len(l) for l in labels)
 
+    # All file hashes in a single read of the archive
+    file_hashes = compute_file_hashes(
+        result.file_path, [a for a in all_algos if a not in tree_hashes]
+    )
+
     hashes = {}
     output.info("\n{label}:  {archive_path}", label=f"{'Archive':<{pad}}",
                 archive_path=str(result.file_path), name="archive.path")
@@ -78,7 +88,7 @@ def _step_display(
         if algo in tree_hashes:
             h = tree_hashes[algo]
         else:
-            h = compute_file_hash(result.file_path, algo)["value"]
+            h = file_hashes[algo]["value"]
         hashes[algo] = h
         output.info("{label}:  {hash}", label=f"{algo:<{pad}}", hash=h, name="archive.hash")
 
@@ -117,7 +127,8 @@ def _run_archive(config, *, test=None) -> None:
         # archive → zip
         result = _step_archive(
             config.project_root, config.tag, config.project_name,
-            config.remote, config.no_cache, output_dir)
+            config.remote, config.no_cache, output_dir,
+            in_memory=config.archive_format in ("tar", "tar.gz"))
 
         # extract → tree → tar (single extraction via shared function)
         final_path, final_format, tree_hashes = process_project_archive(
@@ -125,8 +136,10 @@ def _run_archive(config, *, test=None) -> None:
             tree_algos=tree_algos, archive_format=config.archive_format,
             tar_args=config.archive_tar_extra_args,
             gzip_args=config.archive_gzip_extra_args,
+            zip_data=result.data,
         )
         result.file_path = final_path
+        result.data = None
         result.format = final_format
 
         # Move to output_dir if specified
@@ -6,6 +6,7 @@ import shutil
 import tempfile
 from pathlib import Path
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 
 from ..latex_build import compile
 from ..git_operations import (
@@ -15,9 +16,10 @@ from ..git_operations import (
     check_tag_validity,
     create_github_release,
     verify_release_on_latest_commit,
+    invalidate_git_cache,
     get_last_commit_info,
     get_release_asset_digest,
-    upload_release_asset,
+    upload_release_assets,
     list_release_assets,
     delete_release_asset,
     archive_zip_project,
@@ -26,8 +28,6 @@ from ..zenodo_operations import ZenodoPublisher, ZenodoError
 from ..archive_operation import (
     FileEntry,
     FileEntryType,
-    compute_file_hash,
-    compute_identity_hash,
     compute_hashes,
     format_hash_info,
     generate_manifest,
@@ -240,6 +240,8 @@ def _step_compile(ctx: PipelineContext) -> None:
 
 def _step_post_compile(ctx: PipelineContext) -> None:
     """Re-check git status and verify release is still valid after compilation."""
+    # The build may have committed or switched branch: re-read refs from git
+    invalidate_git_cache()
     _step_git_check(ctx)
     verify_release_on_latest_commit(ctx.config.project_root, ctx.tag_name)
 
@@ -311,7 +313,7 @@ def _step_archive(ctx: PipelineContext) -> None:
                     sign_mode=entry.effective_sign_mode(ctx.config.signing.sign_mode),
                     is_preview=(dst.suffix.lstrip(".") == "pdf"),
                     has_signature=entry.effective_sign(ctx.config.signing.sign),
-                    external_identifier=compute_identity_hash(dst, ctx.config.identity_hash_algo),
+                    identity_hash_algo=ctx.config.identity_hash_algo,
                 ))
                 output.detail("{src} → {dst}", src=src_path.name, dst=dst.name, name="archive.copy")
 
@@ -319,9 +321,11 @@ def _step_archive(ctx: PipelineContext) -> None:
             # Use project_name (e.g. MyProject-v1.0.0) if rename=true,
             # otherwise use the repo directory name (e.g. my-repo)
             archive_name = ctx.config.project_name if entry.rename else ctx.config.project_root.name
+            # The zip is only an intermediate for tar formats: keep it in memory
             result = archive_zip_project(
                 ctx.config.project_root, ctx.tag_name,
                 archive_name, ctx.output_dir,
+                in_memory=ctx.config.archive_format in ("tar", "tar.gz"),
             )
             # Post-process: tree hashes + optional TAR conversion
             hash_algos = list(ctx.config.hash_algorithms or [])
@@ -333,6 +337,7 @@ def _step_archive(ctx: PipelineContext) -> None:
                 tree_algos=tree_algos, archive_format=ctx.config.archive_format,
                 tar_args=ctx.config.archive_tar_extra_args,
                 gzip_args=ctx.config.archive_gzip_extra_args,
+                zip_data=result.data,
             )
             # Pre-format tree hashes into hashes dict (computed during
             # extraction, can't recompute from the packed archive file)
@@ -350,7 +355,7 @@ def _step_archive(ctx: PipelineContext) -> None:
                 publishers=entry.publishers or ctx.config.default_publishers,
                 sign_mode=entry.effective_sign_mode(ctx.config.signing.sign_mode),
                 has_signature=entry.effective_sign(ctx.config.signing.sign),
-                external_identifier=compute_identity_hash(final_path, ctx.config.identity_hash_algo),
+                identity_hash_algo=ctx.config.identity_hash_algo,
                 hashes=pre_hashes,
             ))
             output.detail("project archive: {filename}", filename=final_path.name, name="archive.project")
@@ -475,7 +480,7 @@ def _step_manifest(ctx: PipelineContext) -> None:
         publishers=manifest_entry_cfg.publishers or ctx.config.default_publishers,
         sign_mode=manifest_entry_cfg.effective_sign_mode(ctx.config.signing.sign_mode),
         has_signature=manifest_entry_cfg.effective_sign(ctx.config.signing.sign),
-        external_identifier=compute_identity_hash(manifest_path, ctx.config.identity_hash_algo),
+        identity_hash_algo=ctx.config.identity_hash_algo,
     )
     # Compute hashes immediately so the manifest entry is ready for signing/identifiers
     compute_hashes([manifest_entry], ctx.config.effective_hash_algorithms)
@@ -488,6 +493,10 @@ def _step_manifest(ctx: PipelineContext) -> None:
 # Step: Sign
 # ---------------------------------------------------------------------------
 
+# gpg signing is one subprocess per file, mostly waiting on gpg-agent
+_MAX_SIGN_WORKERS = 4
+
+
 def _step_sign(ctx: PipelineContext) -> None:
     """Sign all entries that have has_signature=True."""
     to_sign = [af for af in ctx.archived_files if af.has_signature]
@@ -502,24 +511,32 @@ def _step_sign(ctx: PipelineContext) -> None:
     sig_dir = ctx.output_dir / "gpg_sign"
     sig_dir.mkdir(exist_ok=True)
 
-    for af in to_sign:
+    def sign(af: FileEntry) -> Path:
         if af.sign_mode == SignMode.FILE:
-            sig_path = gpg_sign_file(
+            return gpg_sign_file(
                 af.file_path, sig_dir,
                 gpg_uid=ctx.config.gpg_uid,
                 extra_args=ctx.config.gpg_extra_args,
             )
-        elif af.sign_mode == SignMode.FILE_HASH:
-            hash_value = af.hashes[ctx.config.identity_hash_algo]["formatted_value"]
-            hash_file = sig_dir / f"{af.file_path.name}.{ctx.config.identity_hash_algo}"
-            hash_file.write_text(hash_value, encoding="ascii")
-            sig_path = gpg_sign_file(
-                hash_file, sig_dir,
-                gpg_uid=ctx.config.gpg_uid,
-                extra_args=ctx.config.gpg_extra_args,
-            )
-            hash_file.unlink(missing_ok=True)
+        hash_value = af.hashes[ctx.config.identity_hash_algo]["formatted_value"]
+        hash_file = sig_dir / f"{af.file_path.name}.{ctx.config.identity_hash_algo}"
+        hash_file.write_text(hash_value, encoding="ascii")
+        sig_path = gpg_sign_file(
+            hash_file, sig_dir,
+            gpg_uid=ctx.config.gpg_uid,
+            extra_args=ctx.config.gpg_extra_args,
+        )
+        hash_file.unlink(missing_ok=True)
+        return sig_path
+
+    # The first signature may go through pinentry; once gpg-agent has the
+    # passphrase cached, the remaining gpg processes can run side by side.
+    sig_paths = [sign(to_sign[0])]
+    if len(to_sign) > 1:
+        with ThreadPoolExecutor(max_workers=min(_MAX_SIGN_WORKERS, len(to_sign) - 1)) as pool:
+            sig_paths += pool.map(sign, to_sign[1:])
 
+    for af, sig_path in zip(to_sign, sig_paths):
         parent_fce = next(
             (fce for fce in ctx.config.generated_files if fce.key == af.config_key), None
         )
@@ -531,7 +548,7 @@ def _step_sign(ctx: PipelineContext) -> None:
             type=FileEntryType.SIG,
             archive=_resolve_archive(FileEntryType.SIG, None, parent_fce, ctx.config),
             publishers=af.publishers,
-            external_identifier=compute_identity_hash(sig_path, ctx.config.identity_hash_algo),
+            identity_hash_algo=ctx.config.identity_hash_algo,
         )
         compute_hashes([sig_af], ctx.config.effective_hash_algorithms)
         ctx.archived_files.append(sig_af)
@@ -656,7 +673,7 @@ def _step_modules(ctx: PipelineContext) -> None:
                 publishers=PublisherDestinations(destination=dest_raw),
                 module_name=module_name,
                 module_entry_type=rf.get("module_entry_type"),
-                external_identifier=compute_identity_hash(Path(rf["file_path"]), ctx.config.identity_hash_algo),
+                identity_hash_algo=ctx.config.identity_hash_algo,
             )
             compute_hashes([fe], ctx.config.effective_hash_algorithms)
             
@@ -866,9 +883,13 @@ def _publish_github(ctx: PipelineContext, github_files: list[FileEntry]) -> None
             else:
                 output.detail_skip("{filename} kept", filename=asset["name"], name="github.leftover_kept")
 
-    # Upload regular files
+    # Collect uploads, then send them in at most two gh calls: new assets,
+    # and assets to overwrite (--clobber) after the user confirmed.
+    new_uploads: list[Path] = []
+    overwrites: list[Path] = []
+
     for af in github_files:
-        local_sha = compute_file_hash(af.file_path, "sha256")["formatted_value"]
+        local_sha = f"sha256:{af.identifier}"  # identifier is the file's sha256
         remote_sha = get_release_asset_digest(
             ctx.config.project_root, ctx.tag_name, af.file_path.name,
         )
@@ -885,17 +906,16 @@ def _publish_github(ctx: PipelineContext, github_files: list[FileEntry]) -> None
                 output.detail_skip("{filename} skipped", filename=af.file_path.name, name="github.asset_skipped")
                 continue
 
-        upload_release_asset(
-            ctx.config.project_root, ctx.tag_name, af.file_path,
-            clobber=bool(remote_sha),
-        )
-        output.detail_ok("{filename} uploaded to release", filename=af.file_path.name, name="github.asset_uploaded")
+        (overwrites if remote_sha else new_uploads).append(af.file_path)
+
+    # .identity_hash.txt files are always overwritten
+    upload_release_assets(ctx.config.project_root, ctx.tag_name, new_uploads)
+    upload_release_assets(ctx.config.project_root, ctx.tag_name,
+                          overwrites + identity_txt_files, clobber=True)
 
-    # Upload .identity_hash.txt files
+    for path in new_uploads + overwrites:
+        output.detail_ok("{filename} uploaded to release", filename=path.name, name="github.asset_uploaded")
     for txt_path in identity_txt_files:
-        upload_release_asset(
-            ctx.config.project_root, ctx.tag_name, txt_path, clobber=True,
-        )
         output.detail_ok("{filename} uploaded to release", filename=txt_path.name, name="github.identity_hash_uploaded")
 
     output.step_ok("GitHub release updated")
@@ -1,6 +1,7 @@
 """Zenodo operations for publishing releases using inveniordm-py."""
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -20,7 +21,11 @@ def get_zenodo_id_from_doi(doi: str) -> str:
     """Extract Zenodo record ID from a DOI string."""
     if not doi:
         return doi
-    return doi.split("zenodo.")[-1]
+    return doi.rpartition("zenodo.")[2]
+
+# Draft file uploads are independent PUT + commit round-trips
+_MAX_UPLOAD_WORKERS = 4
+
 
 class ZenodoPublisher:
     """Zenodo publisher using InvenioRDM API."""
@@ -31,6 +36,9 @@ class ZenodoPublisher:
         self.concept_id = get_zenodo_id_from_doi(config.zenodo_concept_doi)
         self._publication_date = config.publication_date
         self.config = config
+        # Latest record, fetched once by is_up_to_date() and reused by
+        # publish_new_version(); reset once a new version is published
+        self._last_record = None
         self._setup_http_logging()
 
     def _setup_http_logging(self):
@@ -46,11 +54,14 @@ class ZenodoPublisher:
         return self._publication_date or datetime.now(timezone.utc).strftime("%Y-%m-%d")
 
     def _get_last_record(self):
+        if self._last_record is not None:
+            return self._last_record
         try:
             concept_record = self.client.records(self.concept_id).versions.latest()
-            return self.client.records(concept_record.data["id"]).get()
+            self._last_record = self.client.records(concept_record.data["id"]).get()
         except Exception as e:
             raise ZenodoError(f"Failed to find record with id {self.concept_id}: {e}", name="record.not_found")
+        return self._last_record
 
     def _is_draft(self, record_id: str) -> bool:
         try:
@@ -157,22 +168,34 @@ class ZenodoPublisher:
         file_entries = [{"key": af.file_path.name} for af in archived_files]
         draft_record.files.create(FilesListMetadata(file_entries))
 
-        default_preview_file = None
-        for af in archived_files:
-            if af.is_preview:
-                default_preview_file = af.file_path.name
-
+        def upload(af) -> None:
             output.detail("Uploading {filename}...", filename=af.file_path.name, name="uploading")
-            with open(af.file_path, "rb") as f:
-                file_content = f.read()
-
             draft_file = draft_record.files(af.file_path.name)
             stream = OutgoingStream()
-            stream._data = file_content
-            draft_file.set_contents(stream)
+            if af.file_path.stat().st_size == 0:
+                # requests sends an empty file object chunked; empty bytes
+                # get an explicit Content-Length: 0
+                stream._data = b""
+                draft_file.set_contents(stream)
+            else:
+                # requests streams an open file (Content-Length from its size)
+                # instead of holding the whole file in memory
+                with open(af.file_path, "rb") as f:
+                    stream._data = f
+                    draft_file.set_contents(stream)
             draft_file.commit()
             output.detail_ok("{filename} uploaded", filename=af.file_path.name, name="uploaded")
 
+        # Files are uploaded concurrently; list() surfaces the first failure
+        if archived_files:
+            with ThreadPoolExecutor(max_workers=min(_MAX_UPLOAD_WORKERS, len(archived_files))) as pool:
+                list(pool.map(upload, archived_files))
+
+        default_preview_file = None
+        for af in archived_files:
+            if af.is_preview:
+                default_preview_file = af.file_path.name
+
         if default_preview_file:
             draft_record.data["files"]["default_preview"] = default_preview_file
             draft_record.update()
@@ -326,6 +349,7 @@ class ZenodoPublisher:
 
             output.detail("Publishing...")
             published_record = draft_record.publish()
+            self._last_record = None
             record_info = self._format_record_info(published_record)
 
             output.info_ok("Published to Zenodo!")
@@ -34,9 +34,12 @@ REPO_FILES = {
 PROJECT_NAME = f"TestProject-{TAG}"
 
 
-def _setup_repo(tmp_path: Path) -> tuple[Path, Path]:
+def _setup_repo(tmp_path: Path, forced_files: dict | None = None) -> tuple[Path, Path]:
     """Create a repo with known files, bare remote, and a pushed tag.
 
+    *forced_files* are committed with ``git add --force`` (tracked even
+    though .gitignore matches them).
+
     Returns (local_path, output_dir).
     """
     origin = tmp_path / "origin.git"
@@ -54,6 +57,9 @@ def _setup_repo(tmp_path: Path) -> tuple[Path, Path]:
 
     for path, content in REPO_FILES.items():
         git.add_file(path, content)
+    for path, content in (forced_files or {}).items():
+        git.add_file(path, content)
+        git.add("--force", path)
 
     git.add_and_commit("initial")
     git.push("origin", "main")
@@ -301,6 +307,41 @@ def test_archive_tree_hash_tar(tmp_path, fix_log_path):
     assert data["hashes"]["tree"] == local_tree
 
 
+def test_archive_tree_hash_tracked_ignored_file(tmp_path, fix_log_path):
+    """Tracked files matched by the shipped .gitignore: zip and tar tree hashes
+    must equal git add --all + git write-tree on the extracted content."""
+    forced = {"build/figure.pdf": "%PDF-1.4\n", "src/cache.pyc": "\x00\n"}
+    hashes = {}
+    for fmt in ("zip", "tar"):
+        run_dir = tmp_path / fmt
+        run_dir.mkdir()
+        local, output = _setup_repo(run_dir, forced_files=forced)
+        runner = ZpRunner(local)
+        result = runner.run_test(
+            "archive", config={**MINIMAL_CONFIG, "archive": {"format": fmt},
+                               "hash_algorithms": ["tree", "tree256"]},
+            extra_args=["--tag", TAG, "--output-dir", str(output)],
+            log_path=fix_log_path,
+            fail_on="ignore",
+        )
+        data = _get_archive_data(result)
+        archive_path = Path(data["path"])
+
+        for algo, object_format in (("tree", "sha1"), ("tree256", "sha256")):
+            extract_dir = run_dir / f"extracted-{algo}"
+            extract_dir.mkdir()
+            content_dir = fs.extract_archive(archive_path, extract_dir)
+            assert (content_dir / "build" / "figure.pdf").exists()
+
+            local_tree = _compute_tree_hash(content_dir, object_format=object_format)
+            assert data["hashes"][algo] == local_tree, \
+                f"{fmt} {algo} mismatch: zp={data['hashes'][algo]}, local={local_tree}"
+        hashes[fmt] = data["hashes"]
+
+    assert hashes["zip"]["tree"] == hashes["tar"]["tree"]
+    assert hashes["zip"]["tree256"] == hashes["tar"]["tree256"]
+
+
 # ---------------------------------------------------------------------------
 # Content tests — verify actual archive contents on disk
 # ---------------------------------------------------------------------------